@@ -1,11 +1,20 @@
 import argparse
 import asyncio
+import atexit
+import hashlib
 import logging
+import logging.handlers
 import os
+import queue
+import re
+import sqlite3
+import threading
+import time
 from datetime import datetime
 from typing import Literal
-import time
 
+import litellm
+import tiktoken
 from forecasting_tools import (
     AskNewsSearcher,
     BinaryQuestion,
@@ -13,209 +22,189 @@ from forecasting_tools import (
     GeneralLlm,
     MetaculusApi,
     MetaculusQuestion,
+    MonetaryCostManager,
     MultipleChoiceQuestion,
     NumericDistribution,
     NumericQuestion,
     PredictedOptionList,
     PredictionExtractor,
     ReasonedPrediction,
-    SmartSearcher,
     clean_indents,
 )
+from forecasting_tools.ai_models.resource_managers.refreshing_bucket_rate_limiter import (
+    RefreshingBucketRateLimiter,
+)
+from forecasting_tools.data_models.forecast_report import ResearchWithPredictions
 
 logger = logging.getLogger(__name__)
 
+# Matches the "Factor_N :=> google search query" lines the key-factor prompt
+# asks for, so surrounding reasoning text can't be mistaken for a query.
+_FACTOR_RE = re.compile(r"Factor[_ ]?\d+\s*:=>\s*(.+)")
 
-class TemplateForecaster(ForecastBot):
-    """
-    This is a copy of the template bot for Q2 2025 Metaculus AI Tournament.
-    The official bots on the leaderboard use AskNews in Q2.
-    Main template bot changes since Q1
-    - Support for new units parameter was added
-    - You now set your llms when you initialize the bot (making it easier to switch between and benchmark different models)
+_LLM_CACHE_PATH = ".llm_cache.sqlite"
+_LLM_CACHE_TTL_SECONDS = 24 * 60 * 60
 
-    The main entry point of this bot is `forecast_on_tournament` in the parent class.
-    See the script at the bottom of the file for more details on how to run the bot.
-    Ignoring the finer details, the general flow is:
-    - Load questions from Metaculus
-    - For each question
-        - Execute run_research a number of times equal to research_reports_per_question
-        - Execute respective run_forecast function `predictions_per_research_report * research_reports_per_question` times
-        - Aggregate the predictions
-        - Submit prediction (if publish_reports_to_metaculus is True)
-    - Return a list of ForecastReport objects
+_RESEARCH_CACHE_PATH = ".research_cache.sqlite"
+_RESEARCH_CACHE_TTL_SECONDS = 6 * 60 * 60
 
-    Only the research and forecast functions need to be implemented in ForecastBot subclasses.
 
-    If you end up having trouble with rate limits and want to try a more sophisticated rate limiter try:
-    ```
-    from forecasting_tools.ai_models.resource_managers.refreshing_bucket_rate_limiter import RefreshingBucketRateLimiter
-    rate_limiter = RefreshingBucketRateLimiter(
-        capacity=2,
-        refresh_rate=1,
-    ) # Allows 1 request per second on average with a burst of 2 requests initially. Set this as a class variable
-    await self.rate_limiter.wait_till_able_to_acquire_resources(1) # 1 because it's consuming 1 request (use more if you are adding a token limit)
-    ```
-    Additionally OpenRouter has large rate limits immediately on account creation
+class _SqliteTtlCache:
+    """
+    Minimal disk-backed key/value cache. Entries older than the TTL are
+    treated as misses on read, so stale values age out without a sweeper.
+    get/set do blocking disk IO, so async callers dispatch them through
+    asyncio.to_thread; the single shared connection is guarded by a lock.
     """
 
-    _max_concurrent_questions = (
-        2  # Set this to whatever works for your search-provider/ai-model rate limits
-    )
-    _concurrency_limiter = asyncio.Semaphore(_max_concurrent_questions)
-
-    async def _factor_research(self, question: MetaculusQuestion) -> str:
-        """
-        This function will identify key factors for the question and then query news on those factors.
-        """
-
-        async with self._concurrency_limiter:
-            # Step 1: Generate 5 key factors
-            key_factors_prompt = clean_indents(
-                f"""
-                You are an assistant to a superforecaster. 
-                The superforecaster will give you a question they intend to forecast on.  
-                When possible, try to get a diverse range of perspectives if the question is controversial. 
-                Use your judgment in deciding the most relevant information. 
-                You do not produce forecasts yourself - you are responsible for coming up with Google search queries to find relevant information.
-
-                Tips for identifying key factors:
-                - Consider historical trends and base rates.
-                - Identify major drivers or variables that could influence the outcome.
-                - Think about external events, policies, or technological changes.
-                - Be creative and think outside the box.
-                - Consider the implications of the question and its context.
-                - Be sure to include the status quo outcome and the current trend. (Factors 1 and 2 at least)
-
-                The question is:
-                {question.question_text}
-
-                Your task is to list 5 key factors that could influence the outcome of this question.
-                Provide the factors as a numbered list with a brief explanation for each.
-
-                The last thing you write is:
-                Factor_1 :=> google search query for Factor_1
-                Factor_2 :=> google search query for Factor_2
-                ...
-                Factor_5 :=> google search query for Factor_5
-                """
-            )
-            key_factors_response = await self.get_llm("default", "llm").invoke(
-                key_factors_prompt
-            )
-
-            logger.info(
-                f"Key factors for question {question.page_url}:\n{key_factors_response}"
+    def __init__(self, path: str, ttl_seconds: float) -> None:
+        self._path = path
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self._path, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses"
+                " (key TEXT PRIMARY KEY, ts REAL, response TEXT)"
             )
-
-            # Extract the 5 factors from the response (assuming they are in a numbered list)
-            key_factors = key_factors_response.split("\n")[:5]
-            for i in range(len(key_factors)):
-                # Remove the numbering and any leading/trailing whitespace
-                key_factors[i] = key_factors[i].split(":=>")[-1].strip()
-
-            # Step 2: Research each factor using AskNews
-            if os.getenv("ASKNEWS_CLIENT_ID") and os.getenv("ASKNEWS_SECRET"):
-                general_research = await AskNewsSearcher().get_formatted_news_async(
-                    question.question_text
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._get_connection().execute(
+                "SELECT ts, response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        ts, response = row
+        if time.time() - ts > self._ttl_seconds:
+            return None
+        return response
+
+    def set(self, key: str, response: str) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                    (key, time.time(), response),
                 )
 
-                research = ""
-                for factor in key_factors:
-                    try:
-                        factor_research = (
-                            await AskNewsSearcher().get_formatted_news_async(factor)
-                        )
-                        research += f"Research on '{factor}':\n{factor_research}\n\n"
-                    except Exception as e:
-                        logger.warning(f"Error researching factor '{factor}': {e}")
-
-                    time.sleep(1)  # Rate limit for AskNews API
-            else:
-                logger.warning("AskNews credentials not found. Skipping research.")
 
-            full_research = f"""Research for question {question.page_url}:
-                        Here is the general background information you will require to answer the question. The majority of your reasoning will be based around this information:
-                        {general_research}
+_llm_cache = _SqliteTtlCache(_LLM_CACHE_PATH, _LLM_CACHE_TTL_SECONDS)
+_research_cache = _SqliteTtlCache(_RESEARCH_CACHE_PATH, _RESEARCH_CACHE_TTL_SECONDS)
 
-                        Here is the research on the key factors:
-                        {research}"""
 
-            logger.info(f"Research for question {question.page_url}:\n{full_research}")
-            return full_research
+class CachedLlm(GeneralLlm):
+    """
+    A GeneralLlm with a disk-backed response cache keyed by sha256(model + prompt).
+    Only deterministic (temperature=0) calls are cached so that repeated sampling at
+    higher temperatures stays independent; on a cache hit (e.g. retries or re-runs of
+    test_questions) the provider round-trip is skipped entirely.
+    """
 
-    async def run_research(self, question: MetaculusQuestion) -> str:
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # litellm_kwargs holds the effective temperature (GeneralLlm defaults
+        # it to 0), so caching also covers llms built without an explicit one.
+        self._cache_enabled = self.litellm_kwargs.get("temperature") == 0
 
-        time.sleep(1)  # Rate limit for AskNews API
+    async def invoke(self, prompt) -> str:
+        if not self._cache_enabled or not isinstance(prompt, str):
+            return await super().invoke(prompt)
+        key = hashlib.sha256(f"{self.model}\0{prompt}".encode()).hexdigest()
+        cached_response = await asyncio.to_thread(_llm_cache.get, key)
+        if cached_response is not None:
+            logger.info("LLM cache hit for model %s", self.model)
+            return cached_response
+        response = await super().invoke(prompt)
+        await asyncio.to_thread(_llm_cache.set, key, response)
+        return response
 
-        async with self._concurrency_limiter:
-            research = ""
-            if os.getenv("ASKNEWS_CLIENT_ID") and os.getenv("ASKNEWS_SECRET"):
-                try:
-                    research = await AskNewsSearcher().get_formatted_news_async(
-                        question.question_text
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Error researching question '{question.question_text}': {e}"
-                    )
-            elif os.getenv("EXA_API_KEY"):
-                research = await self._call_exa_smart_searcher(question.question_text)
-            elif os.getenv("PERPLEXITY_API_KEY"):
-                research = await self._call_perplexity(question.question_text)
-            elif os.getenv("OPENROUTER_API_KEY"):
-                research = await self._call_perplexity(
-                    question.question_text, use_open_router=True
-                )
-            else:
-                logger.warning(
-                    f"No research provider found when processing question URL {question.page_url}. Will pass back empty string."
-                )
-                research = ""
-            logger.info(f"Found Research for URL {question.page_url}:\n{research}")
-            return research
 
-    async def _run_forecast_on_binary(
-        self, question: BinaryQuestion, research: str
-    ) -> ReasonedPrediction[float]:
-        prompt = clean_indents(
-            f"""
-            You are a professional forecaster interviewing for a job.
+_TODAY_STR_TTL_SECONDS = 60
+_today_str_cache: tuple[float, str] | None = None
 
-            The very first think you should do is restate the question in your own words to ensure you understand it correctly.
-            Then, you will identify key factors that could influence the outcome of this question. 
 
-            Break down the question into its components and think about the implications of each component. Ask yourself: what would need to happen for this question to be true?
+def _today_str() -> str:
+    """
+    The current date as YYYY-MM-DD, recomputed at most once a minute instead
+    of per prompt build.
+    """
+    global _today_str_cache
+    now = time.monotonic()
+    if _today_str_cache is None or now - _today_str_cache[0] > _TODAY_STR_TTL_SECONDS:
+        _today_str_cache = (now, datetime.now().strftime("%Y-%m-%d"))
+    return _today_str_cache[1]
 
-            If we are thinking about an event 100 years into the future you should step into it year by year. Base yourself on fact as much as possible.
-            If you are thinking about how 100 people might behave, you should think first about how 99 of them would behave, then 98 of them, and so on.
 
-            Be conservative in your estimates. If you are not sure, it is better to be conservative and give a lower estimate than to be overly optimistic.
+# Token budgets applied to research text before it is embedded in the forecast
+# prompts, so one oversized news blob can't multiply the prefill cost of every
+# prediction sample.
+_RESEARCH_TOKEN_BUDGET = 4000
+_GENERAL_RESEARCH_TOKEN_BUDGET = 2000
+_FACTOR_RESEARCH_TOKEN_BUDGET = 500
+_CHARS_PER_TOKEN_ESTIMATE = 4
 
-            While you are in the interview the single most important think you can do is reason out loud and explain your reasoning to the interviewer. This allows you to show your reasoning and helps the interviewer understand your thought process. If you make a mistake this allows you to correct it and show that you are a good forecaster.
 
-            Your interview question is:
-            {question.question_text}
+def _truncate_to_token_budget(text: str, max_tokens: int) -> str:
+    """
+    Trim text to at most max_tokens, falling back to a chars-per-token
+    estimate if the tiktoken encoding cannot be loaded.
+    """
+    try:
+        encoding = tiktoken.get_encoding("o200k_base")
+        tokens = encoding.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        logger.info(
+            "Truncating research from %d to %d tokens", len(tokens), max_tokens
+        )
+        return encoding.decode(tokens[:max_tokens])
+    except Exception:
+        max_chars = max_tokens * _CHARS_PER_TOKEN_ESTIMATE
+        if len(text) <= max_chars:
+            return text
+        logger.info(
+            "Truncating research from %d to %d characters", len(text), max_chars
+        )
+        return text[:max_chars]
 
-            <background>
-            {question.background_info}
-            </background> 
 
-            Please use the information and research gathered by your trusted assistant below:
-            <research>
-            {research}
-            </research>
+# The prompt templates below are dedented once at import time; only the dynamic
+# fields are substituted when a forecast is run.
+# All three question types share the same interviewing preamble; keeping a
+# single copy means future prompt edits land everywhere and the shared prefix
+# stays byte-identical across calls.
+_FORECASTER_PREAMBLE = clean_indents(
+    """
+    You are a professional forecaster interviewing for a job.
 
-            This question's outcome will be determined by the specific resolution criteria below. Assume this criteria is not yet satisfied:
-            <resolution criteria>
-            {question.resolution_criteria}
+    The very first think you should do is restate the question in your own words to ensure you understand it correctly.
+    Then, you will identify key factors that could influence the outcome of this question.
 
-            {question.fine_print}
-            </resolution criteria>
+    Break down the question into its components and think about the implications of each component. Ask yourself: what would need to happen for this question to be true?
+
+    If we are thinking about an event 100 years into the future you should step into it year by year. Base yourself on fact as much as possible.
+    If you are thinking about how 100 people might behave, you should think first about how 99 of them would behave, then 98 of them, and so on.
 
-            Today is {datetime.now().strftime("%Y-%m-%d")}.
+    Be conservative in your estimates. If you are not sure, it is better to be conservative and give a lower estimate than to be overly optimistic.
 
+    While you are in the interview the single most important think you can do is reason out loud and explain your reasoning to the interviewer. This allows you to show your reasoning and helps the interviewer understand your thought process. If you make a mistake this allows you to correct it and show that you are a good forecaster.
+    """
+)
 
+# Each template keeps every static instruction (preamble, tips, output format)
+# in a byte-identical prefix above the ---------- delimiter, with the
+# per-question fields below it, so provider-side prompt caching
+# (OpenAI/Anthropic/Gemini prefix caching) can skip re-prefilling the shared
+# prefix on every call.
+_BINARY_PROMPT_TEMPLATE = _FORECASTER_PREAMBLE + clean_indents(
+    """
             Here are top tips from good forecasters:
 
             (1) If an event was anticipated to happen in a certain timeframe, but 80% of that time has passed and there is no recent news or updates about it happening soon, then you should be skeptical that it will happen on the originally stated timeframe. It probably means that it will be delayed or plans have changed. Some examples:
@@ -260,60 +249,34 @@ class TemplateForecaster(ForecastBot):
             (e) A brief description of a scenario that results in a Yes outcome.
             
             The last thing you write is your final answer as: "Probability: ZZ%", 0-100
-            """
-        )
-        reasoning = await self.get_llm("default", "llm").invoke(prompt)
-
-        prediction: float = PredictionExtractor.extract_last_percentage_value(
-            reasoning, max_prediction=1, min_prediction=0
-        )
-        logger.info(
-            f"Forecasted URL {question.page_url} as {prediction} with reasoning:\n{reasoning}"
-        )
-        return ReasonedPrediction(prediction_value=prediction, reasoning=reasoning)
-
-    async def _run_forecast_on_multiple_choice(
-        self, question: MultipleChoiceQuestion, research: str
-    ) -> ReasonedPrediction[PredictedOptionList]:
-        prompt = clean_indents(
-            f"""
-            You are a professional forecaster interviewing for a job.
-
-            The very first think you should do is restate the question in your own words to ensure you understand it correctly.
-            Then, you will identify key factors that could influence the outcome of this question. 
-
-            Break down the question into its components and think about the implications of each component. Ask yourself: what would need to happen for this question to be true?
 
-            If we are thinking about an event 100 years into the future you should step into it year by year. Base yourself on fact as much as possible.
-            If you are thinking about how 100 people might behave, you should think first about how 99 of them would behave, then 98 of them, and so on.
-
-            Be conservative in your estimates. If you are not sure, it is better to be conservative and give a lower estimate than to be overly optimistic.
-
-            While you are in the interview the single most important think you can do is reason out loud and explain your reasoning to the interviewer. This allows you to show your reasoning and helps the interviewer understand your thought process. If you make a mistake this allows you to correct it and show that you are a good forecaster.
+            ----------
 
             Your interview question is:
-            {question.question_text}
-
-            The options are: {question.options}
+            {question_text}
 
             <background>
-            {question.background_info}
+            {background_info}
             </background> 
 
-            Please use the information and research provided by your trusted assistant below:
+            Please use the information and research gathered by your trusted assistant below:
             <research>
             {research}
             </research>
 
             This question's outcome will be determined by the specific resolution criteria below. Assume this criteria is not yet satisfied:
             <resolution criteria>
-            {question.resolution_criteria}
+            {resolution_criteria}
 
-            {question.fine_print}
+            {fine_print}
             </resolution criteria>
 
-            Today is {datetime.now().strftime("%Y-%m-%d")}.
+            Today is {today}.
+    """
+)
 
+_MULTIPLE_CHOICE_PROMPT_TEMPLATE = _FORECASTER_PREAMBLE + clean_indents(
+    """
             Before answering you write:
             (a) The time left until the outcome to the question is known.
             (b) The status quo outcome if nothing changed.
@@ -329,58 +292,15 @@ class TemplateForecaster(ForecastBot):
             - Pay close attention to the exact wording and resolution source in the resolution criteria. Sometimes newspaper articles will cite a number that is significantly different from the number in the resolution criteria. Make sure to pay attention to the resolution criteria.
             - Like a good forecaster, you should use your own judgment to come to the most accurate forecast.
 
-            The last thing you write is your final probabilities for the options in this order {question.options} as:
-
-            FINAL FORECAST
-            [text of first option]: [Probability of first option] %
-            [text of second option]: [Probability of second option] %
-            ...
-            [text of last option]: [Probability of last option] %
-
-            For [text of first option], replace it with the actual text from this list: {question.options}.
-            For [Probability first option], replace it with the probability of the first option. It should be an integer 1-99.
-            Do not write any text after the percent sign for your probability of an option.
-            """
-        )
-        reasoning = await self.get_llm("default", "llm").invoke(prompt)
-
-        prediction: PredictedOptionList = (
-            PredictionExtractor.extract_option_list_with_percentage_afterwards(
-                reasoning, question.options
-            )
-        )
-        logger.info(
-            f"Forecasted URL {question.page_url} as {prediction} with reasoning:\n{reasoning}"
-        )
-        return ReasonedPrediction(prediction_value=prediction, reasoning=reasoning)
-
-    async def _run_forecast_on_numeric(
-        self, question: NumericQuestion, research: str
-    ) -> ReasonedPrediction[NumericDistribution]:
-        upper_bound_message, lower_bound_message = (
-            self._create_upper_and_lower_bound_messages(question)
-        )
-        prompt = clean_indents(
-            f"""
-            You are a professional forecaster interviewing for a job.
-
-            The very first think you should do is restate the question in your own words to ensure you understand it correctly.
-            Then, you will identify key factors that could influence the outcome of this question. 
-
-            Break down the question into its components and think about the implications of each component. Ask yourself: what would need to happen for this question to be true?
-
-            If we are thinking about an event 100 years into the future you should step into it year by year. Base yourself on fact as much as possible.
-            If you are thinking about how 100 people might behave, you should think first about how 99 of them would behave, then 98 of them, and so on.
-
-            Be conservative in your estimates. If you are not sure, it is better to be conservative and give a lower estimate than to be overly optimistic.
-
-            While you are in the interview the single most important think you can do is reason out loud and explain your reasoning to the interviewer. This allows you to show your reasoning and helps the interviewer understand your thought process. If you make a mistake this allows you to correct it and show that you are a good forecaster.
+            ----------
 
             Your interview question is:
-            {question.question_text}
+            {question_text}
+
+            The options are: {options}
 
             <background>
-            {question.background_info}
+            {background_info}
             </background> 
 
             Please use the information and research provided by your trusted assistant below:
@@ -390,13 +310,29 @@ class TemplateForecaster(ForecastBot):
 
             This question's outcome will be determined by the specific resolution criteria below. Assume this criteria is not yet satisfied:
             <resolution criteria>
-            {question.resolution_criteria}
+            {resolution_criteria}
 
-            {question.fine_print}
+            {fine_print}
             </resolution criteria>
 
-            Today is {datetime.now().strftime("%Y-%m-%d")}.
+            Today is {today}.
 
+            The last thing you write is your final probabilities for the options in this order {options} as:
+
+            FINAL FORECAST
+            [text of first option]: [Probability of first option] %
+            [text of second option]: [Probability of second option] %
+            ...
+            [text of last option]: [Probability of last option] %
+
+            For [text of first option], replace it with the actual text from this list: {options}.
+            For [Probability first option], replace it with the probability of the first option. It should be an integer 1-99.
+            Do not write any text after the percent sign for your probability of an option.
+    """
+)
+
+_NUMERIC_PROMPT_TEMPLATE = _FORECASTER_PREAMBLE + clean_indents(
+    """
             Before answering you write:
             (a) The time left until the outcome to the question is known.
             (b) The outcome if nothing changed.
@@ -407,8 +343,6 @@ class TemplateForecaster(ForecastBot):
             You write your rationale remembering that (1) good forecasters put extra weight on the status quo outcome since the world changes slowly most of the time, and (2) good forecasters err on the side of having wide confidence intervals to account for unexpected outcomes.
 
             Important tips: 
-            - Your 20th percentile forecast should be greater than the lower bound of {question.lower_bound}.
-            - Your 80th percentile forecast should be less than the upper bound of {question.upper_bound}.
             - Have a wide range for your tails since you might not have all the information, or might be misunderstanding something.
             - Historically your 80/20 confidence interval has been much too narrow. To be more calibrated make your P10 to P90 4x wider than your P20 to P80 interval. These wide tails will help your calibration.
             - Think about if there are seasonal effects.
@@ -416,10 +350,6 @@ class TemplateForecaster(ForecastBot):
             - Pay close attention to the exact wording and resolution source in the resolution criteria. Sometimes newspaper articles will cite a number that is significantly different from the number in the resolution criteria. Make sure to pay attention to the resolution criteria.
             - Like a good forecaster, use your own judgment!
 
-            Units for answer: {question.unit_of_measure if question.unit_of_measure else "Not stated (please infer this)"}
-            {lower_bound_message}
-            {upper_bound_message}
-
             Formatting Instructions:
             - Please notice the units requested (e.g. whether you represent a number as 1,000,000 or 1 million).
             - Never use scientific notation.
@@ -435,17 +365,541 @@ class TemplateForecaster(ForecastBot):
             Percentile 80: XX
             Percentile 90: XX
             
-            """
+
+            ----------
+
+            Your interview question is:
+            {question_text}
+
+            <background>
+            {background_info}
+            </background> 
+
+            Please use the information and research provided by your trusted assistant below:
+            <research>
+            {research}
+            </research>
+
+            This question's outcome will be determined by the specific resolution criteria below. Assume this criteria is not yet satisfied:
+            <resolution criteria>
+            {resolution_criteria}
+
+            {fine_print}
+            </resolution criteria>
+
+            Today is {today}.
+
+            Units for answer: {unit_of_measure}
+            {lower_bound_message}
+            {upper_bound_message}
+            - Your 20th percentile forecast should be greater than the lower bound of {lower_bound}.
+            - Your 80th percentile forecast should be less than the upper bound of {upper_bound}.
+    """
+)
+
+
+class TemplateForecaster(ForecastBot):
+    """
+    This is a copy of the template bot for Q2 2025 Metaculus AI Tournament.
+    The official bots on the leaderboard use AskNews in Q2.
+    Main template bot changes since Q1
+    - Support for new units parameter was added
+    - You now set your llms when you initialize the bot (making it easier to switch between and benchmark different models)
+
+    The main entry point of this bot is `forecast_on_tournament` in the parent class.
+    See the script at the bottom of the file for more details on how to run the bot.
+    Ignoring the finer details, the general flow is:
+    - Load questions from Metaculus
+    - For each question
+        - Execute run_research a number of times equal to research_reports_per_question
+        - Execute respective run_forecast function `predictions_per_research_report * research_reports_per_question` times
+        - Aggregate the predictions
+        - Submit prediction (if publish_reports_to_metaculus is True)
+    - Return a list of ForecastReport objects
+
+    Only the research and forecast functions need to be implemented in ForecastBot subclasses.
+
+    Request pacing is handled by the RefreshingBucketRateLimiter token buckets
+    below: the semaphore only bounds how many questions are in flight, while
+    the buckets shape the actual AskNews and LLM request rates. Tune
+    MAX_CONCURRENT_QUESTIONS (env var) and the bucket rates to whatever your
+    providers allow. Additionally OpenRouter has large rate limits immediately
+    on account creation
+    """
+
+    _max_concurrent_questions = int(os.getenv("MAX_CONCURRENT_QUESTIONS", "16"))
+    _concurrency_limiter = asyncio.Semaphore(_max_concurrent_questions)
+
+    # ~1 request per second on average with a small initial burst, per provider.
+    _asknews_rate_limiter = RefreshingBucketRateLimiter(capacity=2, refresh_rate=1)
+    _llm_rate_limiter = RefreshingBucketRateLimiter(capacity=10, refresh_rate=1)
+
+    _asknews_searcher: AskNewsSearcher | None = None
+
+    def _get_asknews_searcher(self) -> AskNewsSearcher:
+        """
+        Lazily build a single AskNewsSearcher so its HTTP client (and thus
+        connection pool) is reused across queries and questions instead of
+        paying a fresh TLS handshake per request.
+        """
+        if self._asknews_searcher is None:
+            self._asknews_searcher = AskNewsSearcher()
+        return self._asknews_searcher
+
+    async def _rate_limited_invoke(self, llm: GeneralLlm, prompt: str) -> str:
+        await self._llm_rate_limiter.wait_till_able_to_acquire_resources(1)
+        return await llm.invoke(prompt)
+
+    async def _invoke_default_llm(self, prompt: str) -> str:
+        return await self._rate_limited_invoke(self.get_llm("default", "llm"), prompt)
+
+    @classmethod
+    def _llm_config_defaults(cls) -> dict[str, str | GeneralLlm]:
+        defaults = super()._llm_config_defaults()
+        # Key-factor generation falls back to the default llm unless a cheap
+        # fast model is configured under "key_factors".
+        return {"key_factors": defaults["default"], **defaults}
+
+    def _get_key_factor_llm(self) -> GeneralLlm:
+        """
+        The key-factor step only writes five short search queries, so it is
+        worth routing to a cheap fast model configured under "key_factors".
+        """
+        return self.get_llm("key_factors", "llm")
+
+    async def _factor_research(self, question: MetaculusQuestion) -> str:
+        """
+        This function will identify key factors for the question and then query news on those factors.
+        """
+
+        # Without AskNews credentials none of the factor queries can be
+        # researched, so bail out before spending an LLM call generating them.
+        if not (os.getenv("ASKNEWS_CLIENT_ID") and os.getenv("ASKNEWS_SECRET")):
+            logger.warning("AskNews credentials not found. Skipping research.")
+            return ""
+
+        cache_key = f"factor_research:{question.id_of_post or question.question_text}"
+        cached_research = await asyncio.to_thread(_research_cache.get, cache_key)
+        if cached_research is not None:
+            logger.info("Research cache hit for %s", question.page_url)
+            return cached_research
+
+        async with self._concurrency_limiter:
+            # Step 1: Generate 5 key factors
+            key_factors_prompt = clean_indents(
+                f"""
+                You are an assistant to a superforecaster. 
+                The superforecaster will give you a question they intend to forecast on.  
+                When possible, try to get a diverse range of perspectives if the question is controversial. 
+                Use your judgment in deciding the most relevant information. 
+                You do not produce forecasts yourself - you are responsible for coming up with Google search queries to find relevant information.
+
+                Tips for identifying key factors:
+                - Consider historical trends and base rates.
+                - Identify major drivers or variables that could influence the outcome.
+                - Think about external events, policies, or technological changes.
+                - Be creative and think outside the box.
+                - Consider the implications of the question and its context.
+                - Be sure to include the status quo outcome and the current trend. (Factors 1 and 2 at least)
+
+                The question is:
+                {question.question_text}
+
+                Your task is to list 5 key factors that could influence the outcome of this question.
+                Provide the factors as a numbered list with a brief explanation for each.
+
+                The last thing you write is:
+                Factor_1 :=> google search query for Factor_1
+                Factor_2 :=> google search query for Factor_2
+                ...
+                Factor_5 :=> google search query for Factor_5
+                """
+            )
+            key_factors_response = await self._rate_limited_invoke(
+                self._get_key_factor_llm(), key_factors_prompt
+            )
+
+            logger.info(
+                "Key factors for question %s:\n%s",
+                question.page_url,
+                key_factors_response,
+            )
+
+            # Extract the 5 "Factor_N :=> query" lines from the response
+            key_factors = [
+                factor.strip()
+                for factor in _FACTOR_RE.findall(key_factors_response)[:5]
+            ]
+            if not key_factors:
+                logger.warning(
+                    "No factor queries found in key-factor response for %s",
+                    question.page_url,
+                )
+
+            # Step 2: Research the question and each factor using AskNews (concurrently)
+            searcher = self._get_asknews_searcher()
+
+            async def search_news(query: str) -> str | None:
+                await self._asknews_rate_limiter.wait_till_able_to_acquire_resources(
+                    1
+                )
+                try:
+                    return await searcher.get_formatted_news_async(query)
+                except Exception as e:
+                    logger.warning("Error researching '%s': %s", query, e)
+                    return None
+
+            queries = [question.question_text, *key_factors]
+            results = await asyncio.gather(
+                *(search_news(query) for query in queries)
+            )
+
+            general_research = _truncate_to_token_budget(
+                results[0] or "", _GENERAL_RESEARCH_TOKEN_BUDGET
+            )
+            factor_parts = []
+            for factor, factor_research in zip(key_factors, results[1:]):
+                if factor_research is not None:
+                    factor_research = _truncate_to_token_budget(
+                        factor_research, _FACTOR_RESEARCH_TOKEN_BUDGET
+                    )
+                    factor_parts.append(
+                        f"Research on '{factor}':\n{factor_research}"
+                    )
+            research = "\n\n".join(factor_parts)
+
+            full_research = f"""Research for question {question.page_url}:
+                        Here is the general background information you will require to answer the question. The majority of your reasoning will be based around this information:
+                        {general_research}
+
+                        Here is the research on the key factors:
+                        {research}"""
+
+            # The full blob is multi-KB; keep it out of INFO so routine runs
+            # don't pay for formatting and writing it.
+            logger.info(
+                "Research for question %s: %d characters",
+                question.page_url,
+                len(full_research),
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Research for question %s:\n%s", question.page_url, full_research
+                )
+            if general_research or research:
+                # Don't let an AskNews outage stick an empty blob for the TTL.
+                await asyncio.to_thread(_research_cache.set, cache_key, full_research)
+            return full_research
+
+    async def run_research(self, question: MetaculusQuestion) -> str:
+
+        # Across process restarts and tournament re-runs the same open question
+        # comes back; reuse recent research instead of re-hitting the providers.
+        cache_key = f"research:{question.id_of_post or question.question_text}"
+        cached_research = await asyncio.to_thread(_research_cache.get, cache_key)
+        if cached_research is not None:
+            logger.info("Research cache hit for %s", question.page_url)
+            return cached_research
+
+        async with self._concurrency_limiter:
+            research = ""
+            if os.getenv("ASKNEWS_CLIENT_ID") and os.getenv("ASKNEWS_SECRET"):
+                try:
+                    await self._asknews_rate_limiter.wait_till_able_to_acquire_resources(
+                        1
+                    )
+                    research = await self._get_asknews_searcher().get_formatted_news_async(
+                        question.question_text
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "Error researching question '%s': %s",
+                        question.question_text,
+                        e,
+                    )
+            elif os.getenv("EXA_API_KEY"):
+                research = await self._call_exa_smart_searcher(question.question_text)
+            elif os.getenv("PERPLEXITY_API_KEY"):
+                research = await self._call_perplexity(question.question_text)
+            elif os.getenv("OPENROUTER_API_KEY"):
+                research = await self._call_perplexity(
+                    question.question_text, use_open_router=True
+                )
+            else:
+                logger.warning(
+                    "No research provider found when processing question URL %s. Will pass back empty string.",
+                    question.page_url,
+                )
+                research = ""
+            research = _truncate_to_token_budget(research, _RESEARCH_TOKEN_BUDGET)
+            logger.info(
+                "Found research for URL %s: %d characters",
+                question.page_url,
+                len(research),
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Found research for URL %s:\n%s", question.page_url, research
+                )
+            if research:
+                await asyncio.to_thread(_research_cache.set, cache_key, research)
+            return research
+
+    async def _research_and_make_predictions(
+        self, question: MetaculusQuestion
+    ) -> ResearchWithPredictions:
+        """
+        Override of the parent fan-out: instead of sending the identical prompt
+        predictions_per_research_report times, ask the provider for that many
+        samples in one request so the prompt is only transmitted and prefilled
+        once. Research and summarization run exactly once either way; only the
+        sampling+extraction portion falls back to the parent's per-prediction
+        calls if batching fails. That fan-out (and the top-up path in
+        _invoke_for_samples) already runs the individual calls concurrently
+        with asyncio.gather, so the serial cost is at worst one call's latency
+        rather than N.
+        """
+        if self.predictions_per_research_report <= 1:
+            return await super()._research_and_make_predictions(question)
+
+        notepad = await self._get_notepad(question)
+        notepad.num_research_reports_attempted += 1
+        research = await self.run_research(question)
+        summary_report = await self.summarize_research(question, research)
+        research_to_use = (
+            summary_report if self.use_research_summary_to_forecast else research
         )
-        reasoning = await self.get_llm("default", "llm").invoke(prompt)
 
-        prediction: NumericDistribution = (
-            PredictionExtractor.extract_numeric_distribution_from_list_of_percentile_number_and_probability(
+        n = self.predictions_per_research_report
+        try:
+            notepad.num_predictions_attempted += n
+            predictions, errors = await self._make_batched_predictions(
+                question, research_to_use, n
+            )
+        except Exception as e:
+            logger.warning(
+                "Batched sampling failed for %s; falling back to individual prediction calls: %s",
+                question.page_url,
+                e,
+            )
+            # _make_prediction counts each attempt itself, so undo the batch's
+            # upfront increment before re-attempting individually.
+            notepad.num_predictions_attempted -= n
+            tasks = [
+                self._make_prediction(question, research_to_use) for _ in range(n)
+            ]
+            predictions, errors, exception_group = (
+                await self._gather_results_and_exceptions(tasks)
+            )
+            if errors:
+                logger.warning("Encountered errors while predicting: %s", errors)
+            if len(predictions) == 0:
+                assert exception_group, "Exception group should not be None"
+                self._reraise_exception_with_prepended_message(
+                    exception_group,
+                    "Error while running research and predictions",
+                )
+        return ResearchWithPredictions(
+            research_report=research,
+            summary_report=summary_report,
+            errors=errors,
+            predictions=predictions,
+        )
+
+    async def _make_batched_predictions(
+        self, question: MetaculusQuestion, research_to_use: str, n: int
+    ) -> tuple[list[ReasonedPrediction], list[str]]:
+        if isinstance(question, BinaryQuestion):
+            prompt = self._build_binary_prompt(question, research_to_use)
+            extract = lambda reasoning: PredictionExtractor.extract_last_percentage_value(
+                reasoning, max_prediction=1, min_prediction=0
+            )
+        elif isinstance(question, MultipleChoiceQuestion):
+            prompt = self._build_multiple_choice_prompt(question, research_to_use)
+            extract = lambda reasoning: PredictionExtractor.extract_option_list_with_percentage_afterwards(
+                reasoning, question.options
+            )
+        elif isinstance(question, NumericQuestion):
+            prompt = self._build_numeric_prompt(question, research_to_use)
+            extract = lambda reasoning: PredictionExtractor.extract_numeric_distribution_from_list_of_percentile_number_and_probability(
                 reasoning, question
             )
+        else:
+            raise ValueError(f"Unknown question type: {type(question)}")
+
+        reasonings = await self._invoke_for_samples(
+            self.get_llm("default", "llm"), prompt, n
+        )
+
+        predictions = []
+        errors = []
+        for reasoning in reasonings:
+            try:
+                # Extraction is regex-heavy; parse off the event loop so other
+                # questions keep streaming while this one is scored.
+                prediction = await asyncio.to_thread(extract, reasoning)
+            except Exception as e:
+                errors.append(f"{e.__class__.__name__}: {e}")
+                continue
+            logger.info(
+                "Forecasted URL %s as %s with reasoning:\n%s",
+                question.page_url,
+                prediction,
+                reasoning,
+            )
+            predictions.append(
+                ReasonedPrediction(prediction_value=prediction, reasoning=reasoning)
+            )
+        if len(predictions) == 0:
+            raise RuntimeError(
+                f"No predictions could be extracted from the batch: {errors}"
+            )
+        if errors:
+            logger.warning("Encountered errors while predicting: %s", errors)
+        return predictions, errors
+
+    async def _invoke_for_samples(
+        self, llm: GeneralLlm, prompt: str, n: int
+    ) -> list[str]:
+        """
+        Request n completions of one prompt in a single provider call,
+        topping up with individual concurrent calls if the provider returns
+        fewer (e.g. when litellm drops an unsupported n parameter) or
+        rejects the batched request outright.
+        """
+        await self._llm_rate_limiter.wait_till_able_to_acquire_resources(n)
+        MonetaryCostManager.raise_error_if_limit_would_be_reached()
+        try:
+            response = await litellm.acompletion(
+                messages=llm.model_input_to_message(prompt),
+                n=n,
+                **llm.litellm_kwargs,
+            )
+            # The direct litellm call skips GeneralLlm's accounting, so record
+            # the batch's cost in the active cost managers ourselves the same
+            # way GeneralLlm does for its own calls.
+            cost = response._hidden_params.get("response_cost") or 0
+            cost += llm.calculate_per_request_cost(llm.model)
+            MonetaryCostManager.increase_current_usage_in_parent_managers(cost)
+            reasonings = [
+                choice.message.content
+                for choice in response.choices
+                if isinstance(choice.message.content, str)
+            ]
+        except Exception as e:
+            logger.warning(
+                "n-sampling request failed for model %s; issuing individual calls instead: %s",
+                llm.model,
+                e,
+            )
+            reasonings = []
+        if len(reasonings) < n:
+            extra_reasonings = await asyncio.gather(
+                *(llm.invoke(prompt) for _ in range(n - len(reasonings)))
+            )
+            reasonings.extend(extra_reasonings)
+        return reasonings
+
+    def _build_binary_prompt(self, question: BinaryQuestion, research: str) -> str:
+        return _BINARY_PROMPT_TEMPLATE.format(
+            question_text=question.question_text,
+            background_info=question.background_info,
+            research=research,
+            resolution_criteria=question.resolution_criteria,
+            fine_print=question.fine_print,
+            today=_today_str(),
+        )
+
+    async def _run_forecast_on_binary(
+        self, question: BinaryQuestion, research: str
+    ) -> ReasonedPrediction[float]:
+        prompt = self._build_binary_prompt(question, research)
+        reasoning = await self._invoke_default_llm(prompt)
+
+        prediction: float = await asyncio.to_thread(
+            PredictionExtractor.extract_last_percentage_value,
+            reasoning,
+            max_prediction=1,
+            min_prediction=0,
         )
         logger.info(
-            f"Forecasted URL {question.page_url} as {prediction.declared_percentiles} with reasoning:\n{reasoning}"
+            "Forecasted URL %s as %s with reasoning:\n%s",
+            question.page_url,
+            prediction,
+            reasoning,
+        )
+        return ReasonedPrediction(prediction_value=prediction, reasoning=reasoning)
+
+    def _build_multiple_choice_prompt(
+        self, question: MultipleChoiceQuestion, research: str
+    ) -> str:
+        return _MULTIPLE_CHOICE_PROMPT_TEMPLATE.format(
+            question_text=question.question_text,
+            options=question.options,
+            background_info=question.background_info,
+            research=research,
+            resolution_criteria=question.resolution_criteria,
+            fine_print=question.fine_print,
+            today=_today_str(),
+        )
+
+    async def _run_forecast_on_multiple_choice(
+        self, question: MultipleChoiceQuestion, research: str
+    ) -> ReasonedPrediction[PredictedOptionList]:
+        prompt = self._build_multiple_choice_prompt(question, research)
+        reasoning = await self._invoke_default_llm(prompt)
+
+        prediction: PredictedOptionList = await asyncio.to_thread(
+            PredictionExtractor.extract_option_list_with_percentage_afterwards,
+            reasoning,
+            question.options,
+        )
+        logger.info(
+            "Forecasted URL %s as %s with reasoning:\n%s",
+            question.page_url,
+            prediction,
+            reasoning,
+        )
+        return ReasonedPrediction(prediction_value=prediction, reasoning=reasoning)
+
+    def _build_numeric_prompt(self, question: NumericQuestion, research: str) -> str:
+        upper_bound_message, lower_bound_message = (
+            self._create_upper_and_lower_bound_messages(question)
+        )
+        return _NUMERIC_PROMPT_TEMPLATE.format(
+            question_text=question.question_text,
+            background_info=question.background_info,
+            research=research,
+            resolution_criteria=question.resolution_criteria,
+            fine_print=question.fine_print,
+            today=_today_str(),
+            lower_bound=question.lower_bound,
+            upper_bound=question.upper_bound,
+            unit_of_measure=(
+                question.unit_of_measure
+                if question.unit_of_measure
+                else "Not stated (please infer this)"
+            ),
+            lower_bound_message=lower_bound_message,
+            upper_bound_message=upper_bound_message,
+        )
+
+    async def _run_forecast_on_numeric(
+        self, question: NumericQuestion, research: str
+    ) -> ReasonedPrediction[NumericDistribution]:
+        prompt = self._build_numeric_prompt(question, research)
+        reasoning = await self._invoke_default_llm(prompt)
+
+        prediction: NumericDistribution = await asyncio.to_thread(
+            PredictionExtractor.extract_numeric_distribution_from_list_of_percentile_number_and_probability,
+            reasoning,
+            question,
+        )
+        logger.info(
+            "Forecasted URL %s as %s with reasoning:\n%s",
+            question.page_url,
+            prediction.declared_percentiles,
+            reasoning,
         )
         return ReasonedPrediction(prediction_value=prediction, reasoning=reasoning)
 
@@ -467,12 +921,84 @@ class TemplateForecaster(ForecastBot):
         return upper_bound_message, lower_bound_message
 
 
+async def _run_bot(
+    template_bot: TemplateForecaster,
+    run_mode: Literal["tournament", "quarterly_cup", "test_questions"],
+):
+    """
+    Run the chosen mode inside one event loop, so the LLM/search clients (and
+    their connection pools) live for the whole process instead of being torn
+    down with a per-mode asyncio.run.
+    """
+    if run_mode == "tournament":
+        template_bot.skip_previously_forecasted_questions = True
+        return await template_bot.forecast_on_tournament(
+            MetaculusApi.CURRENT_AI_COMPETITION_ID, return_exceptions=True
+        )
+    elif run_mode == "quarterly_cup":
+        # The quarterly cup is a good way to test the bot's performance on regularly open questions. You can also use AXC_2025_TOURNAMENT_ID = 32564
+        # The new quarterly cup may not be initialized near the beginning of a quarter
+        template_bot.skip_previously_forecasted_questions = False
+        return await template_bot.forecast_on_tournament(
+            MetaculusApi.CURRENT_QUARTERLY_CUP_ID, return_exceptions=True
+        )
+    else:
+        # Example questions are a good way to test the bot's performance on a single question
+        EXAMPLE_QUESTIONS = [
+            "https://www.metaculus.com/questions/578/human-extinction-by-2100/",  # Human Extinction - Binary
+            # "https://www.metaculus.com/questions/31273/will-a-new-war-kill-at-least-5000-people-in-2025/",
+            # "https://www.metaculus.com/questions/22954/crypto-to-surpass-gold-before-2035/",
+            "https://www.metaculus.com/questions/14333/age-of-oldest-human-as-of-2100/",  # Age of Oldest Human - Numeric
+            "https://www.metaculus.com/questions/22427/number-of-new-leading-ai-labs/",  # Number of New Leading AI Labs - Multiple Choice
+            # "https://www.metaculus.com/questions/21017/next-pope/",
+            # "https://www.metaculus.com/questions/37321/who-will-be-the-2028-republican-nominee-for-president-of-the-united-states/"
+            # "https://www.metaculus.com/questions/36460/number-of-times-starship-reaches-160km-in-2025/"
+            # "https://www.metaculus.com/questions/37151/george-santos-sentence-length/",
+            # "https://www.metaculus.com/questions/34751/home-battery-annual-frequency-imbalance-return/",
+            # "https://www.metaculus.com/questions/36881/medicaid-cut-over-10-years-in-2025-reconciliation-bill/",
+            # "https://www.metaculus.com/questions/26327/us-measles-outbreak-2025/",
+            # "https://www.metaculus.com/questions/605/global-warming-in-2100-over-1880-baseline/",
+            # "https://www.metaculus.com/questions/9062/time-from-weak-agi-to-superintelligence/",
+            # "https://www.metaculus.com/questions/31817/h5-case-fatality-rate-in-us/",
+        ]
+        template_bot.skip_previously_forecasted_questions = False
+        # get_question_by_url is synchronous, so fetch the questions in worker
+        # threads concurrently instead of serially blocking the event loop.
+        questions = await asyncio.gather(
+            *(
+                asyncio.to_thread(MetaculusApi.get_question_by_url, question_url)
+                for question_url in EXAMPLE_QUESTIONS
+            )
+        )
+        return await template_bot.forecast_questions(
+            questions, return_exceptions=True
+        )
+
+
 if __name__ == "__main__":
+    try:
+        import uvloop
+    except ImportError:
+        pass  # uvloop is Linux/macOS only; fall back to the default event loop
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
+    # Emit log records from a background thread so async code never blocks on
+    # console IO.
+    root_logger = logging.getLogger()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_listener = logging.handlers.QueueListener(
+        log_queue, *root_logger.handlers, respect_handler_level=True
+    )
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    queue_listener.start()
+    atexit.register(queue_listener.stop)
+
     # Suppress LiteLLM logging
     litellm_logger = logging.getLogger("LiteLLM")
     litellm_logger.setLevel(logging.WARNING)
@@ -504,52 +1030,14 @@ if __name__ == "__main__":
         folder_to_save_reports_to=None,
         skip_previously_forecasted_questions=True,
         llms={  # choose your model names or GeneralLlm llms here, otherwise defaults will be chosen for you
-            "default": GeneralLlm(model="metaculus/o4-mini", temperature=1),
-            "summarizer": GeneralLlm(model="metaculus/o4-mini", temperature=1),
+            "default": CachedLlm(model="metaculus/o4-mini", temperature=1),
+            "summarizer": CachedLlm(model="metaculus/o4-mini", temperature=1),
+            # Key-factor generation is a short structured-output task, so a
+            # cheap fast model is plenty; at temperature 0 its responses are
+            # deterministic and therefore actually served from the cache.
+            "key_factors": CachedLlm(model="metaculus/gpt-4o-mini", temperature=0),
         },
     )
 
-    if run_mode == "tournament":
-        template_bot.skip_previously_forecasted_questions = True
-        forecast_reports = asyncio.run(
-            template_bot.forecast_on_tournament(
-                MetaculusApi.CURRENT_AI_COMPETITION_ID, return_exceptions=True
-            )
-        )
-    elif run_mode == "quarterly_cup":
-        # The quarterly cup is a good way to test the bot's performance on regularly open questions. You can also use AXC_2025_TOURNAMENT_ID = 32564
-        # The new quarterly cup may not be initialized near the beginning of a quarter
-        template_bot.skip_previously_forecasted_questions = False
-        forecast_reports = asyncio.run(
-            template_bot.forecast_on_tournament(
-                MetaculusApi.CURRENT_QUARTERLY_CUP_ID, return_exceptions=True
-            )
-        )
-    elif run_mode == "test_questions":
-        # Example questions are a good way to test the bot's performance on a single question
-        EXAMPLE_QUESTIONS = [
-            "https://www.metaculus.com/questions/578/human-extinction-by-2100/",  # Human Extinction - Binary
-            # "https://www.metaculus.com/questions/31273/will-a-new-war-kill-at-least-5000-people-in-2025/",
-            # "https://www.metaculus.com/questions/22954/crypto-to-surpass-gold-before-2035/",
-            "https://www.metaculus.com/questions/14333/age-of-oldest-human-as-of-2100/",  # Age of Oldest Human - Numeric
-            "https://www.metaculus.com/questions/22427/number-of-new-leading-ai-labs/",  # Number of New Leading AI Labs - Multiple Choice
-            # "https://www.metaculus.com/questions/21017/next-pope/",
-            # "https://www.metaculus.com/questions/37321/who-will-be-the-2028-republican-nominee-for-president-of-the-united-states/"
-            # "https://www.metaculus.com/questions/36460/number-of-times-starship-reaches-160km-in-2025/"
-            # "https://www.metaculus.com/questions/37151/george-santos-sentence-length/",
-            # "https://www.metaculus.com/questions/34751/home-battery-annual-frequency-imbalance-return/",
-            # "https://www.metaculus.com/questions/36881/medicaid-cut-over-10-years-in-2025-reconciliation-bill/",
-            # "https://www.metaculus.com/questions/26327/us-measles-outbreak-2025/",
-            # "https://www.metaculus.com/questions/605/global-warming-in-2100-over-1880-baseline/",
-            # "https://www.metaculus.com/questions/9062/time-from-weak-agi-to-superintelligence/",
-            # "https://www.metaculus.com/questions/31817/h5-case-fatality-rate-in-us/",
-        ]
-        template_bot.skip_previously_forecasted_questions = False
-        questions = [
-            MetaculusApi.get_question_by_url(question_url)
-            for question_url in EXAMPLE_QUESTIONS
-        ]
-        forecast_reports = asyncio.run(
-            template_bot.forecast_questions(questions, return_exceptions=True)
-        )
+    forecast_reports = asyncio.run(_run_bot(template_bot, run_mode))
     TemplateForecaster.log_report_summary(forecast_reports)  # type: ignore